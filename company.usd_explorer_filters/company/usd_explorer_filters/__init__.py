@@ -6,7 +6,7 @@ from typing import Optional
 from .tab_widgets import TabGroup, FilterTab, InfoTab
 from .info_panel import InfoPanel
 from .ui_panel import clear_all_highlights
-from . import csv_bridge
+from . import ui_panel
 from . import stream_bridge
 
 class Extension(omni.ext.IExt):
@@ -21,14 +21,15 @@ class Extension(omni.ext.IExt):
         """
         Called when the extension is loaded.
         
-        Initializes the data bridge, stream bridge, and builds the UI window.
+        Starts the stream bridge and builds the UI window. Prim metadata is
+        loaded lazily by `csv_bridge` on first lookup.
 
         Args:
             ext_id: The unique identifier for this extension instance.
         """
-        # Load prim metadata from CSV
-        csv_bridge.reload_csv()
-        
+        # Watch stage events so the filter panel can drop cached stage data
+        ui_panel.startup()
+
         # Start the stream bridge to listen for WebRTC events
         stream_bridge.startup()
 
@@ -65,6 +66,7 @@ class Extension(omni.ext.IExt):
         
         # Shutdown stream bridge
         stream_bridge.shutdown()
+        ui_panel.shutdown()
         
         # Restore original materials for any highlighted prims
         try:
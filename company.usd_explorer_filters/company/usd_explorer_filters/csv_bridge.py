@@ -1,9 +1,11 @@
+import asyncio
 import os
+import bisect
 import csv
 import re
 import carb
-from typing import Optional, Dict, List
-from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Optional, Dict, List, Iterator, Tuple
 
 # ------------------------------------------------------------------------------
 # Data Structures
@@ -12,11 +14,66 @@ from collections import namedtuple
 # Define the structure for prim information
 # Added 'category' to support dynamic UI grouping
 # Added 'prim_paths' to support multiple prims per entry (first item is the primary path)
-PrimInfo = namedtuple("PrimInfo", ["name", "prim_path", "prim_paths", "category", "type", "contact"])
+# Uses __slots__ instead of a namedtuple to keep per-entry overhead small
+class PrimInfo:
+    """
+    Metadata for a single CSV row (one filter entry).
+    """
+    __slots__ = ("name", "prim_path", "prim_paths", "category", "type", "contact")
+
+    def __init__(self, name: str, prim_path: str, prim_paths: List[str], category: str, type: str, contact: str):
+        self.name = name
+        self.prim_path = prim_path
+        self.prim_paths = prim_paths
+        self.category = category
+        self.type = type
+        self.contact = contact
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PrimInfo):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"PrimInfo({fields})"
 
 # Global dictionary: "Bosch Rexroth" -> PrimInfo(...)
 _PRIM_INFO_BY_NAME: Dict[str, PrimInfo] = {}
 
+# Case-insensitive index: "bosch rexroth" -> [PrimInfo(...), ...], plus its sorted keys for prefix search.
+# Names that differ only in case share a key; their entries are kept in CSV order.
+_PRIM_INFO_BY_LOWER: Dict[str, List[PrimInfo]] = {}
+_SORTED_LOWER: List[str] = []
+
+# Set once reload_csv has run; lookups load the CSV lazily on first access
+_LOADED: bool = False
+
+# Modification time and path of the last successfully parsed CSV, used to skip re-parsing
+_CSV_MTIME_NS: int = -1
+_CSV_PATH_CACHED: str = ""
+
+# Entries grouped by category for the Filter tab, rebuilt when the CSV is reloaded
+# Mapping: category -> [PrimInfo, ...], in CSV order; _GROUPED_MTIME_NS is the mtime it was built from
+_GROUPED_CACHE: Optional[Dict[str, List[PrimInfo]]] = None
+_GROUPED_MTIME_NS: int = -1
+
+# Tables built by one parse: (by_name, by_lower, sorted_lower)
+_CsvTables = Tuple[Dict[str, PrimInfo], Dict[str, List[PrimInfo]], List[str]]
+
+# Columns read from the CSV, in the order rows are yielded by the readers below
+_CSV_COLUMNS = ("name", "path", "category", "type", "contact")
+
+# Read buffer for the csv module path and rows per pandas chunk; bounds peak memory on large files
+_CSV_READ_BUFFER = 1 << 20
+_CSV_CHUNK_ROWS = 50_000
+
+# Number of skipped line numbers listed in the incomplete-rows warning
+_MAX_REPORTED_ROWS = 5
+
+# Separators allowed between multiple prim paths in the 'path' column
+_SPLIT_RE = re.compile(r"[;,]")
+
 
 def _get_csv_path() -> str:
     """
@@ -29,69 +86,287 @@ def _get_csv_path() -> str:
     return os.path.join(here, "prim_info.csv")
 
 
-def reload_csv() -> None:
+@lru_cache(maxsize=None)
+def _get_pandas() -> Optional[Any]:
     """
-    Reads 'prim_info.csv' into memory and populates the global _PRIM_INFO_BY_NAME dictionary.
-    
-    This function should be called on extension startup. It handles missing files
-    and malformed CSV rows gracefully, logging warnings where appropriate.
+    Imports pandas on first use so it stays out of extension startup.
+
+    pandas parses in C and is much faster on large files; callers fall back to
+    the csv module when it is unavailable. The result is cached, so a failed
+    import is not retried on every reload.
+
+    Returns:
+        The pandas module, or None if it cannot be imported.
     """
-    global _PRIM_INFO_BY_NAME
-    _PRIM_INFO_BY_NAME = {}
+    try:
+        import pandas
+    except Exception:
+        return None
+    return pandas
 
-    csv_path = _get_csv_path()
-    if not os.path.exists(csv_path):
-        carb.log_warn(f"[usd_explorer_filters] prim_info.csv not found at: {csv_path}")
-        return
 
+def _read_rows_pandas(pd: Any, csv_path: str) -> Optional[Iterator[Tuple[str, ...]]]:
+    """
+    Parses the CSV with pandas and yields stripped rows in `_CSV_COLUMNS` order.
+
+    The file is read in chunks of `_CSV_CHUNK_ROWS` so only one chunk's DataFrame
+    is alive at a time. Header names are matched after stripping whitespace;
+    missing columns read as "".
+
+    Args:
+        pd: The pandas module returned by `_get_pandas`.
+        csv_path: The absolute path to the CSV file.
+
+    Returns:
+        An iterator of row tuples, or None if the file has no header.
+    """
     try:
-        # Use utf-8-sig to handle potential BOM
-        with open(csv_path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            
-            # Check if the CSV is empty or headers are missing
-            if not reader.fieldnames:
-                 carb.log_warn(f"[usd_explorer_filters] prim_info.csv appears to be empty or invalid.")
-                 return
-
-            for row_idx, row in enumerate(reader, start=2): # Start at 2 for line number (header is 1)
-                # Normalize keys and values by stripping whitespace
-                # This handles cases where headers might have spaces like "name " or " name"
-                clean_row = {k.strip(): (v or "").strip() for k, v in row.items() if k}
-                
-                name = clean_row.get("name", "")
-                prim_path_raw = clean_row.get("path", "")
-                prim_paths = [
-                    p.strip() for p in re.split(r"[;,]", prim_path_raw) if p and p.strip()
-                ]
-                if prim_paths:
-                    prim_path = prim_paths[0]
-                else:
-                    prim_path = ""
-                category = clean_row.get("category") or "Uncategorized"
-                type_ = clean_row.get("type", "")
-                contact = clean_row.get("contact", "")
-
-                if not name or not prim_path:
-                    # Skip incomplete rows but log a warning for visibility
-                    carb.log_warn(f"[usd_explorer_filters] Skipping incomplete row {row_idx} in CSV: name='{name}', path='{prim_path_raw}'")
+        chunks = pd.read_csv(
+            csv_path,
+            usecols=lambda c: str(c).strip() in _CSV_COLUMNS,
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+            encoding="utf-8-sig",
+            chunksize=_CSV_CHUNK_ROWS,
+        )
+    except pd.errors.EmptyDataError:
+        return None
+
+    def _rows() -> Iterator[Tuple[str, ...]]:
+        with chunks:
+            for df in chunks:
+                df.columns = [str(c).strip() for c in df.columns]
+                for col in _CSV_COLUMNS:
+                    df[col] = df[col].str.strip() if col in df.columns else ""
+                yield from df[list(_CSV_COLUMNS)].itertuples(index=False, name=None)
+
+    return _rows()
+
+
+def _read_rows_csv(csv_path: str) -> Optional[Iterator[Tuple[str, ...]]]:
+    """
+    Parses the CSV with the standard library and yields stripped rows in `_CSV_COLUMNS` order.
+
+    Used when pandas is not available. The file stays open until the returned
+    iterator is exhausted.
+
+    Args:
+        csv_path: The absolute path to the CSV file.
+
+    Returns:
+        An iterator of row tuples, or None if the file has no header.
+    """
+    # Use utf-8-sig to handle potential BOM
+    f = open(csv_path, newline="", encoding="utf-8-sig", buffering=_CSV_READ_BUFFER)
+    try:
+        reader = csv.reader(f)
+
+        # Check if the CSV is empty or headers are missing
+        headers = next(reader, None)
+    except Exception:
+        f.close()
+        raise
+    if not headers:
+        f.close()
+        return None
+
+    # Resolve column positions once; strip handles headers like "name " or " name"
+    headers = [h.strip() for h in headers]
+    indices = [headers.index(col) if col in headers else -1 for col in _CSV_COLUMNS]
+
+    def _rows() -> Iterator[Tuple[str, ...]]:
+        with f:
+            for row in reader:
+                if not row:
                     continue
+                n = len(row)
+                yield tuple(row[i].strip() if 0 <= i < n else "" for i in indices)
+
+    return _rows()
+
 
-                _PRIM_INFO_BY_NAME[name] = PrimInfo(
-                    name=name,
-                    prim_path=prim_path,
-                    prim_paths=prim_paths,
-                    category=category,
-                    type=type_,
-                    contact=contact,
-                )
+def _parse_csv(csv_path: str) -> Optional[_CsvTables]:
+    """
+    Parses 'prim_info.csv' into fresh lookup tables without touching module state.
+
+    Safe to run off the main thread; `_install_tables` publishes the result.
 
-        carb.log_info(f"[usd_explorer_filters] Successfully loaded {len(_PRIM_INFO_BY_NAME)} prim rows from CSV")
+    Args:
+        csv_path: The absolute path to the CSV file.
+
+    Returns:
+        The (by_name, by_lower, sorted_lower) tables, or None if the file could not be parsed.
+    """
+    try:
+        pd = _get_pandas()
+        rows = _read_rows_pandas(pd, csv_path) if pd is not None else _read_rows_csv(csv_path)
+        if rows is None:
+            carb.log_warn(f"[usd_explorer_filters] prim_info.csv appears to be empty or invalid.")
+            return None
+
+        # Local aliases keep global/attribute lookups out of the row loop
+        # Build into a fresh dict that _install_tables swaps in, so readers never see a
+        # partially loaded map and a failed reload keeps the previous data
+        new_map: Dict[str, PrimInfo] = {}
+        store = new_map.__setitem__
+        make_info = PrimInfo
+
+        # category/type/contact and prim paths repeat across rows; share one str object per distinct value
+        intern_table: Dict[str, str] = {}
+        intern = intern_table.setdefault
+
+        # Line numbers of incomplete rows, reported in one summary after the loop
+        skipped_rows: List[int] = []
+
+        for row_idx, (name, prim_path_raw, category, type_, contact) in enumerate(rows, start=2): # Start at 2 for line number (header is 1)
+            # Most rows hold a single path; only enter the regex when a separator is present
+            if ";" in prim_path_raw or "," in prim_path_raw:
+                parts = _SPLIT_RE.split(prim_path_raw)
+            else:
+                parts = (prim_path_raw,)
+            # Paths repeat when several rows point at the same prim; share them through the
+            # intern table so the root-keyed caches in ui_panel hit on identity
+            prim_paths = [intern(p, p) for p in (part.strip() for part in parts) if p]
+            if prim_paths:
+                prim_path = prim_paths[0]
+            else:
+                prim_path = ""
+            category = category or "Uncategorized"
+            category = intern(category, category)
+            type_ = intern(type_, type_)
+            contact = intern(contact, contact)
+
+            if not name or not prim_path:
+                # Skip incomplete rows; a summary warning is logged below
+                skipped_rows.append(row_idx)
+                continue
+
+            store(name, make_info(name, prim_path, prim_paths, category, type_, contact))
+
+        if skipped_rows:
+            shown = ", ".join(str(r) for r in skipped_rows[:_MAX_REPORTED_ROWS])
+            more = ", ..." if len(skipped_rows) > _MAX_REPORTED_ROWS else ""
+            carb.log_warn(
+                f"[usd_explorer_filters] Skipped {len(skipped_rows)} incomplete row(s) in CSV "
+                f"missing 'name' or 'path' (lines {shown}{more})"
+            )
+
+        new_lower: Dict[str, List[PrimInfo]] = {}
+        for k, v in new_map.items():
+            new_lower.setdefault(k.lower(), []).append(v)
+        return new_map, new_lower, sorted(new_lower)
 
     except csv.Error as e:
         carb.log_error(f"[usd_explorer_filters] CSV parsing error in {csv_path}: {e}")
     except Exception as e:
         carb.log_error(f"[usd_explorer_filters] Unexpected error reading prim_info.csv: {e}")
+    return None
+
+
+def _install_tables(tables: _CsvTables, csv_path: str, mtime_ns: int) -> None:
+    """
+    Swaps freshly parsed tables in. Runs on the main thread so lookups never see a mix.
+
+    Args:
+        tables: The result of `_parse_csv`.
+        csv_path: The path the tables were parsed from.
+        mtime_ns: The file's modification time when it was parsed.
+    """
+    global _PRIM_INFO_BY_NAME, _PRIM_INFO_BY_LOWER, _SORTED_LOWER, _CSV_MTIME_NS, _CSV_PATH_CACHED
+    global _GROUPED_CACHE
+
+    _PRIM_INFO_BY_NAME, _PRIM_INFO_BY_LOWER, _SORTED_LOWER = tables
+    # Forced reloads keep the same mtime, so drop the grouping explicitly
+    _GROUPED_CACHE = None
+
+    _CSV_MTIME_NS = mtime_ns
+    _CSV_PATH_CACHED = csv_path
+    carb.log_info(f"[usd_explorer_filters] Successfully loaded {len(_PRIM_INFO_BY_NAME)} prim rows from CSV")
+
+
+def _stat_csv(force: bool) -> Tuple[str, Optional[int], bool]:
+    """
+    Locates the CSV and decides whether it needs to be parsed.
+
+    Args:
+        force: Re-parse the file even if it has not changed.
+
+    Returns:
+        (csv_path, mtime_ns or None if the file is missing, whether to reload).
+    """
+    csv_path = _get_csv_path()
+    try:
+        mtime_ns = os.stat(csv_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    changed = force or mtime_ns != _CSV_MTIME_NS or csv_path != _CSV_PATH_CACHED
+    return csv_path, mtime_ns, changed
+
+
+def reload_csv(force: bool = False) -> None:
+    """
+    Reads 'prim_info.csv' into memory and populates the global _PRIM_INFO_BY_NAME dictionary.
+    
+    Lookups call this lazily on first access; call it directly to pick up edits to
+    the file. It handles missing files and malformed CSV rows gracefully, logging
+    warnings where appropriate.
+
+    The file is only re-parsed if its modification time changed since the last
+    successful load.
+
+    Args:
+        force: Re-parse the file even if it has not changed.
+    """
+    global _LOADED
+
+    csv_path, mtime_ns, changed = _stat_csv(force)
+    if not changed:
+        return
+
+    # Mark as loaded up front so a missing or broken file is not re-read on every lookup
+    _LOADED = True
+
+    if mtime_ns is None:
+        carb.log_warn(f"[usd_explorer_filters] prim_info.csv not found at: {csv_path}")
+        return
+
+    tables = _parse_csv(csv_path)
+    if tables is not None:
+        _install_tables(tables, csv_path, mtime_ns)
+
+
+async def reload_csv_async(force: bool = False) -> None:
+    """
+    Like `reload_csv`, but parses the file on a worker thread.
+
+    Only `_parse_csv` runs on the executor; the tables are swapped in after the
+    await, on the calling (main) thread.
+
+    Args:
+        force: Re-parse the file even if it has not changed.
+    """
+    global _LOADED
+
+    csv_path, mtime_ns, changed = _stat_csv(force)
+    if not changed:
+        return
+
+    if mtime_ns is None:
+        _LOADED = True
+        carb.log_warn(f"[usd_explorer_filters] prim_info.csv not found at: {csv_path}")
+        return
+
+    tables = await asyncio.get_event_loop().run_in_executor(None, _parse_csv, csv_path)
+    _LOADED = True
+    if tables is not None:
+        _install_tables(tables, csv_path, mtime_ns)
+
+
+def _ensure_loaded() -> None:
+    """Loads the CSV on first use if `reload_csv` has not run yet."""
+    if not _LOADED:
+        reload_csv()
 
 
 def get_prim_info(name: str) -> Optional[PrimInfo]:
@@ -104,9 +379,46 @@ def get_prim_info(name: str) -> Optional[PrimInfo]:
     Returns:
         The corresponding PrimInfo object, or None if not found.
     """
+    _ensure_loaded()
     return _PRIM_INFO_BY_NAME.get(name)
 
 
+def get_prim_info_ci(name: str) -> Optional[PrimInfo]:
+    """
+    Case-insensitive variant of `get_prim_info`.
+
+    Args:
+        name: The display name to look up, in any letter case.
+
+    Returns:
+        The corresponding PrimInfo object, or None if not found. If several names
+        differ only in case, the first one in the CSV is returned.
+    """
+    _ensure_loaded()
+    matches = _PRIM_INFO_BY_LOWER.get(name.lower())
+    return matches[0] if matches else None
+
+
+def prefix_search(prefix: str) -> List[PrimInfo]:
+    """
+    Finds all entries whose display name starts with `prefix` (case-insensitive).
+
+    Args:
+        prefix: The name prefix to match, e.g. 'bosch'.
+
+    Returns:
+        List[PrimInfo]: Matching entries, ordered by lowercase name.
+    """
+    _ensure_loaded()
+    prefix = prefix.lower()
+    keys = _SORTED_LOWER
+    by_lower = _PRIM_INFO_BY_LOWER
+    # Every key starting with `prefix` sorts between `prefix` and `prefix` + the highest code point
+    start = bisect.bisect_left(keys, prefix)
+    end = bisect.bisect_left(keys, prefix + "\U0010ffff", start)
+    return [info for key in keys[start:end] for info in by_lower[key]]
+
+
 def get_all_prim_info() -> List[PrimInfo]:
     """
     Retrieves all loaded PrimInfo objects.
@@ -114,8 +426,29 @@ def get_all_prim_info() -> List[PrimInfo]:
     Returns:
         List[PrimInfo]: A list of all loaded prim information.
     """
+    _ensure_loaded()
     return list(_PRIM_INFO_BY_NAME.values())
 
 
-# Load immediately when the module is imported to ensure data is available
-reload_csv()
+def get_grouped_prim_info() -> Dict[str, List[PrimInfo]]:
+    """
+    Retrieves all loaded PrimInfo objects grouped by category.
+
+    The grouping is computed once per loaded CSV and shared between callers, so
+    the returned dict and lists must not be modified.
+
+    Returns:
+        Dict[str, List[PrimInfo]]: Category -> entries, both in CSV order.
+    """
+    global _GROUPED_CACHE, _GROUPED_MTIME_NS
+    _ensure_loaded()
+    if _GROUPED_CACHE is None or _GROUPED_MTIME_NS != _CSV_MTIME_NS:
+        # Single pass into an insertion-ordered dict: categories keep their CSV order,
+        # which sorting for itertools.groupby would lose (or need an extra rank pass for)
+        grouped: Dict[str, List[PrimInfo]] = {}
+        for info in _PRIM_INFO_BY_NAME.values():
+            grouped.setdefault(info.category, []).append(info)
+        _GROUPED_CACHE = grouped
+        _GROUPED_MTIME_NS = _CSV_MTIME_NS
+    return _GROUPED_CACHE
+
@@ -1,8 +1,7 @@
-from pxr import Usd, UsdGeom, Gf
+from pxr import Usd, UsdGeom, Gf, Tf
 import omni.usd
 import omni.ui as ui
 import carb
-import omni.kit.app
 from typing import Optional, Tuple, Dict, Any
 
 # Global reference so other modules can reach the active panel
@@ -35,16 +34,23 @@ class InfoPanel:
         self._override_path: Optional[str] = None
         # When a filter is active we may want to display CSV info directly
         self._override_info: Optional[Any] = None
-        # Subscribe to per‑frame updates
-        app = omni.kit.app.get_app()
-        self._update_sub = app.get_update_event_stream().create_subscription_to_pop(
-            self._on_update, name="info_panel_update"
+        # Reused across selections; dropped when the stage is edited, opened or closed
+        self._bbox_cache: Optional[UsdGeom.BBoxCache] = None
+        self._last_area_prim_path: Optional[str] = None
+        self._last_area_value: Optional[float] = None
+        # USD context and stage handles; the stage is refreshed on open/close events
+        self._ctx = omni.usd.get_context()
+        self._stage: Optional[Usd.Stage] = self._ctx.get_stage()
+        # Listener for edits to the current stage, which invalidate the cached bounds
+        self._objects_changed_listener: Optional[Tf.Notice.Listener] = None
+        self._listen_for_stage_edits()
+        # Subscribe to stage events (selection changes) instead of per‑frame polling
+        self._update_sub = self._ctx.get_stage_event_stream().create_subscription_to_pop(
+            self._on_stage_event, name="info_panel_stage_event"
         )
         # Cache meters‑per‑unit if a stage is already open
-        ctx = omni.usd.get_context()
-        stage = ctx.get_stage()
-        if stage:
-            self._meters_per_unit = UsdGeom.GetStageMetersPerUnit(stage) or 1.0
+        if self._stage:
+            self._meters_per_unit = UsdGeom.GetStageMetersPerUnit(self._stage) or 1.0
 
     # ---------------------------------------------------------------------
     # UI construction
@@ -77,17 +83,46 @@ class InfoPanel:
     # ---------------------------------------------------------------------
     # Update handling
     # ---------------------------------------------------------------------
-    def _on_update(self, e: Any) -> None:
-        """Called each frame – poll for selection or override changes."""
-        self._poll_selection()
+    def _on_stage_event(self, e: Any) -> None:
+        """Called on stage events – re‑check the selection when it changes."""
+        if e.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
+            self._poll_selection()
+        elif e.type in (int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)):
+            self._invalidate_stage_caches()
+
+    def _invalidate_stage_caches(self) -> None:
+        """Drop cached per‑stage data so it is rebuilt against the new stage."""
+        self._drop_bounds_cache()
+        self._stage = self._ctx.get_stage()
+        self._meters_per_unit = (UsdGeom.GetStageMetersPerUnit(self._stage) or 1.0) if self._stage else 1.0
+        self._listen_for_stage_edits()
+
+    def _listen_for_stage_edits(self) -> None:
+        """(Re)register the ObjectsChanged listener on the current stage."""
+        if self._objects_changed_listener:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
+        if self._stage:
+            self._objects_changed_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, self._stage
+            )
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        """Moved or resized prims make cached bounds and areas stale."""
+        self._drop_bounds_cache()
+
+    def _drop_bounds_cache(self) -> None:
+        """Forget cached bounds and the last computed area."""
+        self._bbox_cache = None
+        self._last_area_prim_path = None
+        self._last_area_value = None
 
     def _poll_selection(self) -> None:
         """Detect changes in stage selection or overridden prim and update UI."""
-        ctx = omni.usd.get_context()
         if self._override_path:
             paths = (self._override_path,)
         else:
-            sel = ctx.get_selection()
+            sel = self._ctx.get_selection()
             paths = tuple(sel.get_selected_prim_paths() or ())
         if paths != self._last_selection:
             self._last_selection = paths
@@ -115,8 +150,9 @@ class InfoPanel:
             c_type = getattr(self._override_info, "type", "-") or "-"
             c_contact = getattr(self._override_info, "contact", "-") or "-"
         else:
-            c_type = self._find_custom_data(prim, CUSTOM_KEYS["type"]) or "-"
-            c_contact = self._find_custom_data(prim, CUSTOM_KEYS["contact"]) or "-"
+            found = self._find_custom_data_multi(prim, (CUSTOM_KEYS["type"], CUSTOM_KEYS["contact"]))
+            c_type = found.get(CUSTOM_KEYS["type"]) or "-"
+            c_contact = found.get(CUSTOM_KEYS["contact"]) or "-"
         area_est = self._estimate_area_sqm(prim)
         area_str = f"{area_est:,.2f}" if area_est is not None else "-"
         self._type.set_value(str(c_type))
@@ -145,6 +181,9 @@ class InfoPanel:
         """Clean up resources and subscriptions."""
         if hasattr(self, "_update_sub") and self._update_sub:
             self._update_sub = None
+        if self._objects_changed_listener:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
         global info_panel_instance
         if info_panel_instance == self:
             info_panel_instance = None
@@ -154,42 +193,49 @@ class InfoPanel:
     # ---------------------------------------------------------------------
     def _get_prim(self, path: str) -> Optional[Usd.Prim]:
         """Retrieve a prim from the current stage."""
-        stage = omni.usd.get_context().get_stage()
-        return stage.GetPrimAtPath(path) if stage else None
+        return self._stage.GetPrimAtPath(path) if self._stage else None
 
-    def _find_custom_data(self, prim: Usd.Prim, key: str) -> Any:
-        """Walk up the prim hierarchy to find custom data for *key*.
+    def _find_custom_data_multi(self, prim: Usd.Prim, keys: Tuple[str, ...]) -> Dict[str, Any]:
+        """Walk up the prim hierarchy once, resolving every key in *keys*.
 
-        Returns the value if found, otherwise ``None``.
+        The nearest ancestor defining a key wins. Keys that are never found are
+        absent from the returned dict.
         """
+        result: Dict[str, Any] = {}
         cur = prim
         while cur and cur.IsValid():
-            try:
-                data = cur.GetCustomData()
-            except Exception:
-                data = {}
-            if data and key in data:
-                return data[key]
+            for key in keys:
+                if key not in result and cur.HasCustomDataKey(key):
+                    result[key] = cur.GetCustomDataByKey(key)
+            if len(result) == len(keys):
+                break
             cur = cur.GetParent()
-        return None
+        return result
 
     def _estimate_area_sqm(self, prim: Usd.Prim) -> Optional[float]:
         """Estimate the footprint area (X * Y) of *prim* in square meters.
 
         Returns ``None`` if the calculation fails.
         """
+        prim_path = prim.GetPath().pathString
+        if prim_path == self._last_area_prim_path:
+            return self._last_area_value
         try:
-            cache = UsdGeom.BBoxCache(
-                Usd.TimeCode.Default(),
-                includedPurposes=[UsdGeom.Tokens.default_, UsdGeom.Tokens.render, UsdGeom.Tokens.proxy],
-                useExtentsHint=True,
-            )
-            bbox = cache.ComputeWorldBound(prim)
+            if self._bbox_cache is None:
+                self._bbox_cache = UsdGeom.BBoxCache(
+                    Usd.TimeCode.Default(),
+                    includedPurposes=[UsdGeom.Tokens.default_, UsdGeom.Tokens.render, UsdGeom.Tokens.proxy],
+                    useExtentsHint=True,
+                )
+            bbox = self._bbox_cache.ComputeWorldBound(prim)
             size = bbox.ComputeAlignedRange().GetSize()  # X,Y,Z in stage units
             to_m = self._meters_per_unit
             width_m = size[0] * to_m
             depth_m = size[1] * to_m
-            return max(0.0, width_m) * max(0.0, depth_m)
+            area = max(0.0, width_m) * max(0.0, depth_m)
+            self._last_area_prim_path = prim_path
+            self._last_area_value = area
+            return area
         except Exception as e:
             carb.log_warn(f"[USD Explorer Filters] Area estimate failed: {e}")
             return None
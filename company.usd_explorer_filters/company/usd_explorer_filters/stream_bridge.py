@@ -1,5 +1,6 @@
 import carb
 import json
+import sys
 from typing import Dict, Any, Optional
 # Safely import livestream core; may be unavailable in some Kit versions
 try:
@@ -13,23 +14,74 @@ from . import ui_panel
 # Event Handling
 # ------------------------------------------------------------------------------
 
-class StreamBridge:
+_loads = json.loads
+
+# Event name registered with the livestream extension
+_TOGGLE_EVENT = sys.intern("ToggleFilter")
+
+# Livestream interface, resolved once on first use
+_LIVESTREAM: Optional[Any] = None
+
+
+def _get_livestream() -> Optional[Any]:
     """
-    Handles communication with the WebRTC streaming client.
-    Listens for custom events and dispatches them to the UI panel.
+    Returns the livestream interface, fetching it on first call.
+
+    Returns:
+        The livestream object, or None if the extension is unavailable.
     """
-    
-    def __init__(self):
-        # Attempt to retrieve livestream instance safely
+    global _LIVESTREAM
+    if _LIVESTREAM is None:
         if _livestream_core and hasattr(_livestream_core, "get_livestream"):
             try:
-                self._livestream = _livestream_core.get_livestream()
+                _LIVESTREAM = _livestream_core.get_livestream()
             except Exception as e:
                 carb.log_warn(f"[USD Explorer Filters] Failed to obtain livestream: {e}")
-                self._livestream = None
         else:
             carb.log_warn("[USD Explorer Filters] omni.kit.livestream.core not available or missing get_livestream")
-            self._livestream = None
+    return _LIVESTREAM
+
+
+def _extract_payload(event_data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Normalizes 'ToggleFilter' event data into the inner payload dictionary.
+
+    Accepts a dict, a JSON string, or an event object exposing `.payload`
+    (e.g. carb.events.IEvent). The client sends
+    { "event_type": "...", "payload": { ... } }; if the livestream extension
+    already unwrapped it, the data itself is returned.
+
+    Args:
+        event_data: The raw data passed to the event handler.
+
+    Returns:
+        The payload dictionary, or None if the data could not be decoded.
+    """
+    if not isinstance(event_data, (dict, str)) and hasattr(event_data, "payload"):
+        event_data = event_data.payload
+
+    if isinstance(event_data, str):
+        try:
+            event_data = _loads(event_data)
+        except json.JSONDecodeError:
+            return None
+
+    if not isinstance(event_data, dict):
+        return None
+
+    inner = event_data.get("payload")
+    return inner if isinstance(inner, dict) else event_data
+
+
+class StreamBridge:
+    """
+    Handles communication with the WebRTC streaming client.
+    Listens for custom events and dispatches them to the UI panel.
+    """
+    
+    def __init__(self):
+        # Attempt to retrieve livestream instance safely
+        self._livestream = _get_livestream()
         self._event_subscription = None
         
     def startup(self) -> None:
@@ -46,7 +98,7 @@ class StreamBridge:
         # Note: The actual API might vary slightly depending on the Kit version.
         # We assume a standard message event structure here.
         self._event_subscription = self._livestream.register_event_handler(
-            "ToggleFilter", 
+            _TOGGLE_EVENT,
             self._on_toggle_filter
         )
 
@@ -79,39 +131,12 @@ class StreamBridge:
         carb.log_info(f"[USD Explorer Filters] Received 'ToggleFilter' event. Raw data: {event_data}")
 
         try:
-            data = {}
-            
-            # 1. Normalize to dictionary
-            if isinstance(event_data, dict):
-                data = event_data
-            elif isinstance(event_data, str):
-                try:
-                    data = json.loads(event_data)
-                except json.JSONDecodeError:
-                    carb.log_warn(f"[USD Explorer Filters] Failed to decode JSON string: {event_data}")
-                    return
-            elif hasattr(event_data, "payload"):
-                # Handle carb.events.IEvent or similar objects
-                # If it's an IEvent, the data might be in .payload
-                raw_payload = event_data.payload
-                if isinstance(raw_payload, dict):
-                    data = raw_payload
-                elif isinstance(raw_payload, str):
-                     try:
-                        data = json.loads(raw_payload)
-                     except json.JSONDecodeError:
-                        pass # Keep as is if not JSON
-
-            # 2. Extract the actual payload
-            # The client sends { "event_type": "...", "payload": { ... } }
-            # If the livestream extension unwraps it, 'data' might be the inner payload.
-            # If not, 'data' might be the outer object.
-            
-            target_payload = data
-            if "payload" in data and isinstance(data["payload"], dict):
-                target_payload = data["payload"]
-            
-            # 3. Extract fields from the target payload
+            target_payload = _extract_payload(event_data)
+            if target_payload is None:
+                carb.log_warn(f"[USD Explorer Filters] Could not decode 'ToggleFilter' event data: {event_data}")
+                return
+
+            # Extract fields from the target payload
             name = target_payload.get("name")
             active = target_payload.get("active")
             
@@ -71,11 +71,20 @@ class TabGroup:
         self.tabs = tabs
         self.tab_containers: List[ui.Frame] = []
         self.tab_headers: List[ui.ZStack] = []
+        self._current_index: int = -1
+        # Whether each tab's content has been built; content is built on first selection
+        self._tab_built: List[bool] = []
 
         # Creating the UI immediately
         self.frame = ui.Frame(build_fn=self._build_widget)
 
     def _build_widget(self) -> None:
+        # The frame may rebuild; start from a clean slate so indices stay aligned
+        self.tab_containers.clear()
+        self.tab_headers.clear()
+        self._tab_built.clear()
+        self._current_index = -1
+
         with ui.ZStack(style=TAB_GROUP_STYLE):
             ui.Rectangle(style_type_name_override="TabGroupBorder")
             with ui.VStack():
@@ -98,8 +107,10 @@ class TabGroup:
                 # ---- content area ----
                 with ui.ZStack():
                     for idx, tab in enumerate(self.tabs):
-                        container_frame = ui.Frame(build_fn=tab.build_fn)
+                        # Content is built lazily in select_tab
+                        container_frame = ui.Frame()
                         self.tab_containers.append(container_frame)
+                        self._tab_built.append(False)
                         container_frame.visible = False
 
         # show first tab by default
@@ -108,17 +119,28 @@ class TabGroup:
     def select_tab(self, index: int) -> None:
         """
         Switches the visible content to the tab at the given index.
+
+        The tab's content is built the first time it is selected.
         
         Args:
             index: The index of the tab to select.
         """
-        for i in range(len(self.tabs)):
-            if i == index:
-                self.tab_containers[i].visible = True
-                self.tab_headers[i].selected = True
-            else:
-                self.tab_containers[i].visible = False
-                self.tab_headers[i].selected = False
+        if index == self._current_index:
+            return
+
+        # Only the outgoing and incoming tabs change state
+        if self._current_index >= 0:
+            self.tab_containers[self._current_index].visible = False
+            self.tab_headers[self._current_index].selected = False
+
+        if not self._tab_built[index]:
+            with self.tab_containers[index]:
+                self.tabs[index].build_fn()
+            self._tab_built[index] = True
+
+        self.tab_containers[index].visible = True
+        self.tab_headers[index].selected = True
+        self._current_index = index
 
     def _tab_clicked(self, index: int, x: float, y: float, button: int, modifier: int) -> None:
         if button == 0:
@@ -1,12 +1,15 @@
+import asyncio
 import omni.ui as ui
-from pxr import Usd, UsdGeom, UsdShade, Sdf
+from pxr import Usd, UsdGeom, UsdShade, Sdf, Tf
 import omni.usd
+import omni.kit.app
 import carb
 import omni.kit.viewport.utility as vp_utils
 import omni.kit.commands as kit_commands
-from typing import Dict, Optional, Any, List
-from collections import defaultdict
+from typing import Callable, Dict, Optional, Any, List, Set, Tuple
+from functools import partial
 from . import csv_bridge
+from .info_panel import CUSTOM_KEYS
 
 # ------------------------------------------------------------------------------
 # Constants
@@ -15,91 +18,292 @@ from . import csv_bridge
 # Path to the highlight material in the USD stage.
 # This material must exist for highlighting to work.
 HIGHLIGHT_MAT_PATH = "/World/Looks/Highlight_Mat"
+# Parsed once so lookups do not re-parse the string
+_HIGHLIGHT_MAT_SDF_PATH = Sdf.Path(HIGHLIGHT_MAT_PATH)
+
+# Direct material binding relationship. It is authored directly instead of through
+# UsdShade.MaterialBindingAPI.Bind, which applies the API schema on every call.
+# The schema is added to the prim spec only for prims that do not carry it yet.
+_MATERIAL_BINDING_REL = "material:binding"
+_MATERIAL_BINDING_API = "MaterialBindingAPI"
+
+# Marks "no entry" in dict lookups where None is a valid stored value
+_SENTINEL = object()
+
+# Binding edit resolved by the read pass:
+# (prim, material_path or None to unbind, whether MaterialBindingAPI must be applied)
+BindingEdit = Tuple[Usd.Prim, Optional[Sdf.Path], bool]
+
+# Viewport framing function: (viewport_win, viewport_api, focus_path, paths) -> framed
+FrameStrategy = Callable[[Any, Any, str, List[str]], bool]
 
 # ------------------------------------------------------------------------------
 # State Management
 # ------------------------------------------------------------------------------
 
 # Store original material bindings per prim to allow restoration.
-# Mapping: prim_path (str) -> original_material_path (Sdf.Path) or None
-_ORIGINAL_MATERIALS: Dict[str, Optional[Sdf.Path]] = {}
+# Entries are dropped once restored, so the map only holds currently highlighted prims.
+# Keyed by Sdf.Path to avoid converting every prim path to a Python string.
+# Mapping: prim_path (Sdf.Path) -> original_material_path (Sdf.Path) or None
+_ORIGINAL_MATERIALS: Dict[Sdf.Path, Optional[Sdf.Path]] = {}
+
+# Imageable descendants per filter root, collected on the first toggle and reused.
+# Prim handles are kept next to their paths so later toggles skip the path lookup.
+# Mapping: root_path (str) -> [(prim_path (Sdf.Path), prim (Usd.Prim)), ...]
+_IMAGEABLE_CACHE: Dict[str, List[Tuple[Sdf.Path, Usd.Prim]]] = {}
+
+# Resolved filter root prims, dropped on stage open/close
+# Mapping: (id(stage), root_path) -> Usd.Prim
+_ROOT_PRIM_CACHE: Dict[Tuple[int, str], Usd.Prim] = {}
+
+# Highlight material wrapper for the current stage, dropped on stage open/close.
+# A single slot: only one stage is open per context, so entries cannot pile up.
+# Value: (id(stage), UsdShade.Material)
+_HIGHLIGHT_MAT_CACHE: Optional[Tuple[int, UsdShade.Material]] = None
 
 # Registry of filter checkbox models to allow programmatic control
 # Mapping: label (str) -> ui.SimpleBoolModel
 _FILTER_MODELS: Dict[str, ui.SimpleBoolModel] = {}
+# Last value seen per filter checkbox, used to ignore callbacks that did not change it
+# Mapping: label (str) -> bool
+_LAST_VALUE: Dict[str, bool] = {}
+# Filters whose highlight is currently applied to the stage; toggles that would not
+# change membership skip the subtree walk
+_ACTIVE_FILTERS: Set[str] = set()
 # Track which filter currently owns the Info tab override
 _ACTIVE_INFO_LABEL: Optional[str] = None
+# Framing function for the available viewport API, resolved on the first focus
+_FRAME_STRATEGY: Optional[FrameStrategy] = None
+# Stage event subscription used to invalidate stage-dependent caches
+_STAGE_EVENT_SUB: Optional[Any] = None
+# ObjectsChanged listener on the current stage; drops cached subtrees that were resynced
+_OBJECTS_CHANGED_LISTENER: Optional[Tf.Notice.Listener] = None
+# Filter changes queued during the current frame, flushed on the next app update
+# Mapping: label (str) -> (PrimInfo, requested state)
+_PENDING: Dict[str, Tuple[csv_bridge.PrimInfo, bool]] = {}
+_FLUSH_SUB: Optional[Any] = None
+# Background CSV load started by build_panel
+_LOAD_TASK: Optional[asyncio.Future] = None
+
+
+def _get_direct_binding(prim: Usd.Prim) -> Optional[Sdf.Path]:
+    """Returns the target of the prim's direct material binding, if any."""
+    rel = prim.GetRelationship(_MATERIAL_BINDING_REL)
+    targets = rel.GetTargets() if rel else None
+    return targets[0] if targets else None
+
+
+def _bind_direct(prim: Usd.Prim, material_path: Sdf.Path) -> None:
+    """Points the prim's direct material binding at `material_path`."""
+    rel = prim.GetRelationship(_MATERIAL_BINDING_REL) or prim.CreateRelationship(_MATERIAL_BINDING_REL, False)
+    rel.SetTargets([material_path])
+
+
+def _apply_binding_api_spec(layer: Sdf.Layer, spec_path: Sdf.Path) -> None:
+    """
+    Prepends MaterialBindingAPI to the apiSchemas of the prim spec at `spec_path`.
+
+    Authored on the spec rather than through `prim.ApplyAPI` so it can run inside
+    the write pass's `Sdf.ChangeBlock` without reading composed data.
+    """
+    spec = layer.GetPrimAtPath(spec_path) or Sdf.CreatePrimInLayer(layer, spec_path)
+    schemas = spec.GetInfo("apiSchemas") if spec.HasInfo("apiSchemas") else Sdf.TokenListOp()
+    if schemas.isExplicit:
+        schemas.explicitItems = list(schemas.explicitItems) + [_MATERIAL_BINDING_API]
+    else:
+        schemas.prependedItems = list(schemas.prependedItems) + [_MATERIAL_BINDING_API]
+    spec.SetInfo("apiSchemas", schemas)
+
+
+def _unbind_direct(prim: Usd.Prim) -> None:
+    """Clears the prim's direct material binding."""
+    rel = prim.GetRelationship(_MATERIAL_BINDING_REL)
+    if rel:
+        rel.ClearTargets(False)
 
 
-def _set_subtree_highlight_shader(root_path: str, highlighted: bool) -> None:
+def _get_highlight_material(stage: Usd.Stage) -> Optional[UsdShade.Material]:
     """
-    Applies or removes the highlight material on the given prim and all its children.
+    Returns the highlight material on `stage`, reusing the cached wrapper.
 
-    This function recursively traverses the stage from `root_path`. It uses
-    `UsdShade.MaterialBindingAPI` to bind the highlight material. Original bindings
-    are cached in `_ORIGINAL_MATERIALS` to be restored later.
+    Returns:
+        The material, or None if it does not exist on the stage.
+    """
+    global _HIGHLIGHT_MAT_CACHE
+    stage_id = id(stage)
+    cached = _HIGHLIGHT_MAT_CACHE
+    if cached is not None and cached[0] == stage_id and cached[1].GetPrim().IsValid():
+        return cached[1]
+
+    mat_prim = stage.GetPrimAtPath(_HIGHLIGHT_MAT_SDF_PATH)
+    if not mat_prim or not mat_prim.IsValid():
+        _HIGHLIGHT_MAT_CACHE = None
+        return None
+    highlight_mat = UsdShade.Material(mat_prim)
+    _HIGHLIGHT_MAT_CACHE = (stage_id, highlight_mat)
+    return highlight_mat
+
+
+def _collect_imageables(root_prim: Usd.Prim) -> List[Tuple[Sdf.Path, Usd.Prim]]:
+    """
+    Returns (path, prim) pairs for all imageable prims in the subtree rooted at `root_prim`.
+
+    Material and node-graph subtrees (shader networks) cannot contain imageable
+    prims, so their children are pruned instead of visited. Instance proxies are
+    not traversed since their bindings cannot be authored.
+    """
+    imageables: List[Tuple[Sdf.Path, Usd.Prim]] = []
+    add_imageable = imageables.append
+    it = iter(Usd.PrimRange(root_prim, Usd.PrimDefaultPredicate))
+    for prim in it:
+        # Most prims under a filter root are geometry; test that first so they cost one IsA.
+        # Node graphs are never imageable, so the order does not change the result.
+        if prim.IsA(UsdGeom.Imageable):
+            add_imageable((prim.GetPath(), prim))
+        elif prim.IsA(UsdShade.NodeGraph):
+            it.PruneChildren()
+    return imageables
+
+
+def _prepare_subtree_edits(
+    stage: Usd.Stage,
+    root_path: str,
+    highlighted: bool,
+    highlight_mat: Optional[UsdShade.Material] = None,
+    highlighted_paths: Optional[Set[Sdf.Path]] = None,
+) -> List[BindingEdit]:
+    """
+    Read pass of a highlight flush: resolves the binding edits for a subtree.
+
+    Covers the root prim and all its imageable descendants; the resulting
+    `material:binding` edits are authored by `_author_bindings`. Original bindings are cached in
+    `_ORIGINAL_MATERIALS` to be restored later, and released when restored.
+
+    All stage reads happen here, including caching original bindings when turning
+    ON, so the write pass can run inside an `Sdf.ChangeBlock` without reading
+    composed data.
 
     Args:
+        stage: The stage to edit.
         root_path: The absolute USD path to the root prim of the subtree.
         highlighted: True to apply highlight, False to restore original materials.
-    """
-    ctx = omni.usd.get_context()
-    stage = ctx.get_stage()
-    if not stage:
-        carb.log_warn("[USD Explorer Filters] No active stage found.")
-        return
+        highlight_mat: The highlight material, if the caller already resolved it.
+        highlighted_paths: Prims highlighted by other roots in the same batch. Turning
+            ON adds to it; turning OFF leaves these prims and their originals alone.
 
-    root_prim = stage.GetPrimAtPath(root_path)
+    Returns:
+        A list of `BindingEdit`s; a material_path of None means unbind.
+    """
+    # Reuse the resolved root prim for this stage while it is still valid
+    root_key = (id(stage), root_path)
+    root_prim = _ROOT_PRIM_CACHE.get(root_key)
     if not root_prim or not root_prim.IsValid():
-        carb.log_warn(f"[USD Explorer Filters] Root prim not found or invalid: {root_path}")
-        return
+        root_prim = stage.GetPrimAtPath(root_path)
+        if not root_prim or not root_prim.IsValid():
+            _ROOT_PRIM_CACHE.pop(root_key, None)
+            carb.log_warn(f"[USD Explorer Filters] Root prim not found or invalid: {root_path}")
+            return []
+        _ROOT_PRIM_CACHE[root_key] = root_prim
 
     # Get highlight material when turning ON
-    highlight_mat = None
-    if highlighted:
-        mat_prim = stage.GetPrimAtPath(HIGHLIGHT_MAT_PATH)
-        if not mat_prim or not mat_prim.IsValid():
+    if not highlighted:
+        highlight_mat = None
+    elif highlight_mat is None:
+        highlight_mat = _get_highlight_material(stage)
+        if not highlight_mat:
             carb.log_warn(f"[USD Explorer Filters] Highlight material not found at {HIGHLIGHT_MAT_PATH}")
-            return
-        highlight_mat = UsdShade.Material(mat_prim)
+            return []
+    highlight_mat_path = highlight_mat.GetPath() if highlight_mat else None
+
+    # Collect imageable prims under the root once; later toggles reuse the list
+    imageables = _IMAGEABLE_CACHE.get(root_path)
+    if imageables is None:
+        imageables = _collect_imageables(root_prim)
+        _IMAGEABLE_CACHE[root_path] = imageables
+
+    edits: List[BindingEdit] = []
+    # Bound-method locals keep attribute lookups out of the per-prim loop
+    add_edit = edits.append
+    get_original = _ORIGINAL_MATERIALS.get
+    pop_original = _ORIGINAL_MATERIALS.pop
+    # Few distinct materials are shared by many prims; check each one's prim once
+    valid_originals: Dict[Sdf.Path, bool] = {}
+    for prim_path, prim in imageables:
+        if not prim.IsValid():
+            # Handle expired (prim removed or re-created); fall back to a lookup
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim or not prim.IsValid():
+                if not highlighted:
+                    pop_original(prim_path, None)
+                continue
 
-    # Walk root and children
-    for prim in Usd.PrimRange(root_prim):
-        if not prim.IsA(UsdGeom.Imageable):
-            continue
+        if highlighted:
+            if highlighted_paths is not None:
+                highlighted_paths.add(prim_path)
 
-        prim_path = prim.GetPath().pathString
-        binding_api = UsdShade.MaterialBindingAPI(prim)
+            # Remember original direct binding once (single hash lookup per prim)
+            if get_original(prim_path, _SENTINEL) is _SENTINEL:
+                _ORIGINAL_MATERIALS[prim_path] = _get_direct_binding(prim)
 
-        if highlighted:
-            # Remember original direct binding once
-            if prim_path not in _ORIGINAL_MATERIALS:
-                bound = binding_api.GetDirectBinding().GetMaterial()
-                _ORIGINAL_MATERIALS[prim_path] = bound.GetPath() if bound else None
+            # Bind highlight material; bindings on prims without MaterialBindingAPI are
+            # ignored by strict binding resolution, so apply it where missing
+            if highlight_mat_path:
+                add_edit((prim, highlight_mat_path, not prim.HasAPI(UsdShade.MaterialBindingAPI)))
 
-            # Bind highlight material
-            if highlight_mat:
-                binding_api.Bind(highlight_mat)
+        elif highlighted_paths and prim_path in highlighted_paths:
+            # Another root in this batch keeps the prim highlighted; keep its original too
+            continue
 
         else:
-            # Restore original material if we have it
-            if prim_path not in _ORIGINAL_MATERIALS:
+            # Restore original material if we have it; the entry is no longer needed after this
+            original_path = pop_original(prim_path, _SENTINEL)
+            if original_path is _SENTINEL:
                 continue  # we never changed this one
 
-            original_path = _ORIGINAL_MATERIALS[prim_path]
+            # No original (or original material gone) → remove our direct binding
+            add_edit((prim, _restore_target(stage, original_path, valid_originals), False))
 
-            if original_path is None:
-                # No original → remove our direct binding
-                binding_api.UnbindDirectBinding()
-            else:
-                orig_prim = stage.GetPrimAtPath(original_path)
-                if not orig_prim or not orig_prim.IsValid():
-                    # Original material gone? best effort: unbind
-                    binding_api.UnbindDirectBinding()
-                    continue
+    return edits
 
-                original_mat = UsdShade.Material(orig_prim)
-                binding_api.Bind(original_mat)
+
+def _restore_target(
+    stage: Usd.Stage, original_path: Optional[Sdf.Path], valid_originals: Dict[Sdf.Path, bool]
+) -> Optional[Sdf.Path]:
+    """
+    Returns the material path to restore, or None to unbind.
+
+    A recorded original whose prim no longer exists is dropped (best effort: unbind).
+
+    Args:
+        stage: The stage being edited.
+        original_path: The recorded original binding, or None if there was none.
+        valid_originals: Validity per material path, shared across one restore pass.
+    """
+    if original_path is None:
+        return None
+    valid = valid_originals.get(original_path)
+    if valid is None:
+        orig_prim = stage.GetPrimAtPath(original_path)
+        valid = valid_originals[original_path] = bool(orig_prim and orig_prim.IsValid())
+    return original_path if valid else None
+
+
+def _author_bindings(stage: Usd.Stage, edits: List[BindingEdit]) -> None:
+    """
+    Write pass: binds each prim to its material path, or unbinds it when the path is None.
+
+    MaterialBindingAPI is applied in the stage's edit target for edits that ask for it.
+    Callers wrap this in an `Sdf.ChangeBlock`.
+    """
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    for prim, material_path, apply_schema in edits:
+        if material_path is None:
+            _unbind_direct(prim)
+            continue
+        if apply_schema:
+            _apply_binding_api_spec(layer, edit_target.MapToSpecPath(prim.GetPath()))
+        _bind_direct(prim, material_path)
 
 
 def clear_all_highlights() -> None:
@@ -109,58 +313,177 @@ def clear_all_highlights() -> None:
     This should be called on extension shutdown to ensure no temporary highlight
     materials are left in the USD stage.
     """
+    global _HIGHLIGHT_MAT_CACHE
     ctx = omni.usd.get_context()
     stage = ctx.get_stage()
     if not stage:
         return
 
-    for prim_path, original_path in list(_ORIGINAL_MATERIALS.items()):
+    # Read pass: resolve every restore before authoring. Nothing mutates the map
+    # until it is cleared below, so it is iterated without a snapshot.
+    edits: List[BindingEdit] = []
+    valid_originals: Dict[Sdf.Path, bool] = {}
+    for prim_path, original_path in _ORIGINAL_MATERIALS.items():
         prim = stage.GetPrimAtPath(prim_path)
         if not prim or not prim.IsValid():
             continue
 
-        binding_api = UsdShade.MaterialBindingAPI(prim)
+        # No original material (or original material gone) → remove our direct binding
+        edits.append((prim, _restore_target(stage, original_path, valid_originals), False))
 
-        if original_path is None:
-            # No original material → remove our direct binding
-            binding_api.UnbindDirectBinding()
-        else:
-            orig_prim = stage.GetPrimAtPath(original_path)
-            if not orig_prim or not orig_prim.IsValid():
-                # Original material gone → best effort: unbind
-                binding_api.UnbindDirectBinding()
-            else:
-                original_mat = UsdShade.Material(orig_prim)
-                binding_api.Bind(original_mat)
+    # Write pass: batch all restores into one change notification
+    with Sdf.ChangeBlock():
+        _author_bindings(stage, edits)
 
     _ORIGINAL_MATERIALS.clear()
+    _ACTIVE_FILTERS.clear()
+    _IMAGEABLE_CACHE.clear()
+    _ROOT_PRIM_CACHE.clear()
+    _HIGHLIGHT_MAT_CACHE = None
+
+
+def _on_stage_event(e: Any) -> None:
+    """Drops stage-dependent caches when the stage is opened or closed."""
+    global _HIGHLIGHT_MAT_CACHE
+    if e.type in (int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)):
+        # A newly opened stage carries none of our highlights; old-stage originals
+        # would block capture on the new stage and be rebound by clear_all_highlights
+        _ORIGINAL_MATERIALS.clear()
+        _ACTIVE_FILTERS.clear()
+        _IMAGEABLE_CACHE.clear()
+        _ROOT_PRIM_CACHE.clear()
+        _HIGHLIGHT_MAT_CACHE = None
+        _listen_for_stage_edits()
+
+
+def _listen_for_stage_edits() -> None:
+    """(Re)registers the ObjectsChanged listener on the current stage."""
+    global _OBJECTS_CHANGED_LISTENER
+    if _OBJECTS_CHANGED_LISTENER:
+        _OBJECTS_CHANGED_LISTENER.Revoke()
+        _OBJECTS_CHANGED_LISTENER = None
+    stage = omni.usd.get_context().get_stage()
+    if stage:
+        _OBJECTS_CHANGED_LISTENER = Tf.Notice.Register(Usd.Notice.ObjectsChanged, _on_objects_changed, stage)
+
+
+def _on_objects_changed(notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+    """
+    Drops cached subtrees touched by a resync (prims added/removed, payloads loaded).
 
+    A root's entry goes when a resynced prim lies inside its subtree or above it.
+    Property resyncs (e.g. a new material:binding) do not change the prim hierarchy
+    and are ignored.
+    """
+    if not _IMAGEABLE_CACHE and not _ROOT_PRIM_CACHE:
+        return
+    resynced = [path for path in notice.GetResyncedPaths() if not path.IsPropertyPath()]
+    if not resynced:
+        return
+
+    roots = set(_IMAGEABLE_CACHE)
+    roots.update(root_path for _, root_path in _ROOT_PRIM_CACHE)
+    for root_path in roots:
+        root = Sdf.Path(root_path)
+        if any(path.HasPrefix(root) or root.HasPrefix(path) for path in resynced):
+            _IMAGEABLE_CACHE.pop(root_path, None)
+            for key in [key for key in _ROOT_PRIM_CACHE if key[1] == root_path]:
+                del _ROOT_PRIM_CACHE[key]
+
+
+def startup() -> None:
+    """Subscribes to stage events and edits so cached stage data is dropped on stage changes."""
+    global _STAGE_EVENT_SUB
+    _STAGE_EVENT_SUB = omni.usd.get_context().get_stage_event_stream().create_subscription_to_pop(
+        _on_stage_event, name="usd_explorer_filters_stage_event"
+    )
+    _listen_for_stage_edits()
 
-def _apply_csv_metadata(info: csv_bridge.PrimInfo) -> None:
+
+def shutdown() -> None:
+    """Releases the stage subscriptions, drops queued filter changes and stops a pending CSV load."""
+    global _STAGE_EVENT_SUB, _OBJECTS_CHANGED_LISTENER, _FLUSH_SUB, _LOAD_TASK
+    _STAGE_EVENT_SUB = None
+    if _OBJECTS_CHANGED_LISTENER:
+        _OBJECTS_CHANGED_LISTENER.Revoke()
+        _OBJECTS_CHANGED_LISTENER = None
+    _FLUSH_SUB = None
+    _PENDING.clear()
+    if _LOAD_TASK is not None:
+        _LOAD_TASK.cancel()
+        _LOAD_TASK = None
+
+
+def _set_custom_data_by_key(custom: Dict[str, Any], key_path: str, value: Any) -> None:
+    """
+    Sets `key_path` in a customData dict the way `Usd.Object.SetCustomDataByKey` does.
+
+    ':' separates nested dictionaries, so "company:contact" is stored as
+    {"company": {"contact": value}}; `GetCustomDataByKey` reads it back the same way.
+    Nested dicts along the path are copied, so `custom` may hold read-only values.
+    """
+    *parents, leaf = key_path.split(":")
+    for name in parents:
+        child = dict(custom.get(name) or {})
+        custom[name] = child
+        custom = child
+    custom[leaf] = value
+
+
+def _get_custom_data_by_key(custom: Dict[str, Any], key_path: str) -> Any:
+    """Reads `key_path` from a customData dict the way `Usd.Object.GetCustomDataByKey` does."""
+    value: Any = custom
+    for name in key_path.split(":"):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
+
+
+def _apply_csv_metadata(stage: Usd.Stage, info: csv_bridge.PrimInfo) -> None:
     """
     Writes metadata from a PrimInfo object into the prim's customData.
 
-    This allows the InfoPanel to read the data directly from the prim.
+    This allows the InfoPanel to read the data directly from the prim. The keys
+    are authored on the prim spec the edit target maps the prim to (honoring
+    variant or reference edit targets), one customData write per prim; callers
+    wrap this in an `Sdf.ChangeBlock`. Keys come from `info_panel.CUSTOM_KEYS`
+    and are nested by key path, so the Info tab reads exactly what is written;
+    composition merges the nested dict with ones authored in other layers.
 
     Args:
+        stage: The stage to edit.
         info: The PrimInfo object containing metadata.
     """
-    ctx = omni.usd.get_context()
-    stage = ctx.get_stage()
-    if not stage:
+    # Only write if present in CSV
+    updates: List[Tuple[str, str]] = []
+    if info.contact:
+        updates.append((CUSTOM_KEYS["contact"], info.contact))
+    if info.type:
+        updates.append((CUSTOM_KEYS["type"], info.type))
+    if not updates:
         return
 
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
     for path in info.prim_paths:
         prim = stage.GetPrimAtPath(path)
         if not prim or not prim.IsValid():
             carb.log_warn(f"[USD Explorer Filters] Prim not found for CSV row: {path}")
             continue
 
-        # Only write if present in CSV
-        if info.contact:
-            prim.SetCustomDataByKey("company:contact", info.contact)
-        if info.type:
-            prim.SetCustomDataByKey("company:type", info.type)
+        # Merge into the spec's own (nested) customData so keys authored in other layers stay there
+        spec_path = edit_target.MapToSpecPath(prim.GetPath())
+        spec = layer.GetPrimAtPath(spec_path)
+        custom = dict(spec.customData) if spec else {}
+        if all(_get_custom_data_by_key(custom, key) == value for key, value in updates):
+            continue  # already written by an earlier activation; skip the re-author
+
+        for key, value in updates:
+            _set_custom_data_by_key(custom, key, value)
+        if not spec:
+            spec = Sdf.CreatePrimInLayer(layer, spec_path)
+        spec.SetInfo("customData", custom)
 
 
 def _set_info_override(info: Optional[csv_bridge.PrimInfo], active: bool) -> None:
@@ -188,33 +511,139 @@ def _set_info_override(info: Optional[csv_bridge.PrimInfo], active: bool) -> Non
             _ACTIVE_INFO_LABEL = None
             panel.set_override(None, None)
 
-def _on_checkbox_changed(label: str, model: ui.SimpleBoolModel) -> None:
+def _on_checkbox_changed(info: csv_bridge.PrimInfo, model: ui.SimpleBoolModel) -> None:
     """
     Callback for when a filter checkbox is toggled.
 
     Args:
-        label: The label of the checkbox (e.g., "Bosch Rexroth").
+        info: The PrimInfo bound to the checkbox when it was built.
         model: The UI model holding the checkbox state.
     """
+    label = info.name
     value = model.get_value_as_bool()
+    # Value-changed callbacks can fire for identity writes; skip those
+    if _LAST_VALUE.get(label) == value:
+        return
+    _LAST_VALUE[label] = value
     carb.log_info(f"[USD Explorer Filters] Filter '{label}' changed to: {value}")
 
-    # Look up this label in the CSV
-    info = csv_bridge.get_prim_info(label)
-    if not info:
-        carb.log_warn(f"[USD Explorer Filters] No CSV entry found for '{label}'")
-        return
+    # Queue the change and apply all changes from this frame on the next app update.
+    # Flipping a filter back before the flush restores the applied state, so drop it.
+    queued = _PENDING.get(label)
+    if queued is not None and queued[1] != value:
+        del _PENDING[label]
+    else:
+        _PENDING[label] = (info, value)
+
+    global _FLUSH_SUB
+    if _PENDING and _FLUSH_SUB is None:
+        _FLUSH_SUB = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+            _flush_pending, name="usd_explorer_filters_flush"
+        )
+
+
+def _flush_pending(e: Any = None) -> None:
+    """
+    Applies all queued filter changes in one pass.
+
+    Highlight edits for every affected root and the CSV metadata of filters
+    turned on are authored in a single `Sdf.ChangeBlock`; Info tab updates run
+    afterwards.
+    """
+    global _FLUSH_SUB
+    _FLUSH_SUB = None
+
+    pending = list(_PENDING.values())
+    _PENDING.clear()
+
+    # Changes that already match what is applied to the stage skip the stage edits;
+    # they still update the Info tab below
+    resolved = [(info, value) for info, value in pending if (info.name in _ACTIVE_FILTERS) != value]
+
+    # Group by root so a root shared by several filters is edited once (last change wins)
+    root_states: Dict[str, bool] = {}
+    for info, value in resolved:
+        for path in info.prim_paths:
+            root_states[path] = value
+    root_states = _drop_covered_roots(root_states)
+
+    # Fetch the stage once and pass it to every helper
+    stage = omni.usd.get_context().get_stage()
+    if stage:
+        # Resolve the highlight material once for every root being turned ON
+        highlight_mat = _get_highlight_material(stage) if any(root_states.values()) else None
+
+        # Read pass: resolve every binding edit (and cache originals) before authoring.
+        # Roots turned ON go first so roots turned OFF skip prims that stay highlighted
+        # and do not release originals those prims still need.
+        edits: List[BindingEdit] = []
+        highlighted_paths: Set[Sdf.Path] = set()
+        for path, value in root_states.items():
+            if value:
+                edits.extend(_prepare_subtree_edits(stage, path, True, highlight_mat, highlighted_paths))
+        for path, value in root_states.items():
+            if not value:
+                edits.extend(_prepare_subtree_edits(stage, path, False, highlighted_paths=highlighted_paths))
+
+        # Write pass: highlight / unhighlight, and write CSV metadata into prim custom data when turning ON
+        with Sdf.ChangeBlock():
+            _author_bindings(stage, edits)
+            for info, value in resolved:
+                if value:
+                    _apply_csv_metadata(stage, info)
+
+        for info, value in resolved:
+            if value:
+                _ACTIVE_FILTERS.add(info.name)
+            else:
+                _ACTIVE_FILTERS.discard(info.name)
+    elif root_states:
+        carb.log_warn("[USD Explorer Filters] No active stage found.")
+
+    for info, value in pending:
+        _finish_filter(stage, info, value)
 
-    prim_paths = info.prim_paths
 
-    # Highlight / unhighlight
-    for path in prim_paths:
-        _set_subtree_highlight_shader(path, value)
+def _drop_covered_roots(root_states: Dict[str, bool]) -> Dict[str, bool]:
+    """
+    Removes roots whose subtree is already edited through an ancestor root.
+
+    A root nested under another root with the same requested state would be
+    traversed and rebound twice; only the outermost root is kept, so the
+    remaining roots cover disjoint subtrees.
+
+    Args:
+        root_states: Mapping of root path -> requested highlight state.
+
+    Returns:
+        The filtered mapping, in the original order.
+    """
+    if len(root_states) < 2:
+        return root_states
+    sdf_paths = {path: Sdf.Path(path) for path in root_states}
+    return {
+        path: value
+        for path, value in root_states.items()
+        if not any(
+            other != path and other_value == value and sdf_paths[path].HasPrefix(sdf_paths[other])
+            for other, other_value in root_states.items()
+        )
+    }
+
 
-    # When turning ON, write CSV metadata into prim custom data (only if prim exists)
+def _finish_filter(stage: Optional[Usd.Stage], info: csv_bridge.PrimInfo, value: bool) -> None:
+    """
+    Updates the Info tab after a filter's highlight and metadata changed.
+
+    Args:
+        stage: The current stage, or None if no stage is open.
+        info: The PrimInfo of the toggled filter.
+        value: True if the filter was turned on.
+    """
+    prim_paths = info.prim_paths
+
+    # When turning ON, show the filter in the Info tab (only if prim exists)
     if value:
-        ctx = omni.usd.get_context()
-        stage = ctx.get_stage()
         if not stage:
             carb.log_warn("[USD Explorer Filters] Cannot apply filter; no active USD stage.")
             _set_info_override(None, False)
@@ -226,7 +655,6 @@ def _on_checkbox_changed(label: str, model: ui.SimpleBoolModel) -> None:
             _set_info_override(None, False)
             return
 
-        _apply_csv_metadata(info)
         _set_info_override(info, True)
     else:
         _set_info_override(info, False)
@@ -252,6 +680,172 @@ def set_filter_state(label: str, active: bool) -> None:
         carb.log_warn(f"[USD Explorer Filters] Cannot set state for unknown filter: '{label}'")
 
 
+def _frame_via_api_frame_prim(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Newer viewports expose frame_prim on the viewport API."""
+    viewport_api.frame_prim(focus_path)
+    return True
+
+
+def _frame_via_window_frame_prim(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Older viewports expose frame_prim on the window."""
+    viewport_win.frame_prim(focus_path)
+    return True
+
+
+def _frame_via_api_controller(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames through the viewport API's camera controller, by path if supported."""
+    controller = viewport_api.get_viewport_camera_controller()
+    if not controller:
+        return False
+    try:
+        controller.frame_paths(paths)
+    except AttributeError:
+        controller.frame_selection()
+    return True
+
+
+def _frame_via_api_frame_selection(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames the (preselected) prim through the viewport API."""
+    viewport_api.frame_selection()
+    return True
+
+
+def _frame_via_window_frame_selection(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames the (preselected) prim through the viewport window."""
+    viewport_win.frame_selection()
+    return True
+
+
+def _frame_via_window_controller(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames the (preselected) prim through the window's camera controller."""
+    controller = viewport_win.get_viewport_camera_controller()
+    if not controller:
+        return False
+    controller.frame_selection()
+    return True
+
+
+def _frame_via_active_viewport(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames the (preselected) prim through vp_utils.get_active_viewport()."""
+    # Any failure here falls through to the command fallback
+    try:
+        viewport = vp_utils.get_active_viewport()
+        if not viewport:
+            return False
+        viewport.frame_selection()
+        return True
+    except Exception:
+        return False
+
+
+def _frame_via_vp_utils(viewport_win: Any, viewport_api: Any, focus_path: str, paths: List[str]) -> bool:
+    """Frames the prim through the viewport utility module."""
+    vp_utils.frame_prim(focus_path)
+    return True
+
+
+# Strategies that frame by path; every other strategy frames the current selection
+_PATH_FRAME_STRATEGIES = frozenset((_frame_via_api_frame_prim, _frame_via_window_frame_prim, _frame_via_vp_utils))
+
+
+def _resolve_frame_strategy(viewport_win: Any, viewport_api: Any) -> Optional[FrameStrategy]:
+    """
+    Picks the framing function for the viewport API that is available.
+
+    Probes in order of preference, newest API first.
+
+    Args:
+        viewport_win: The active viewport window, or None.
+        viewport_api: The window's viewport API, or None.
+
+    Returns:
+        The framing function, or None if only the command fallback applies.
+    """
+    if viewport_api and hasattr(viewport_api, "frame_prim"):
+        return _frame_via_api_frame_prim
+    if viewport_win and hasattr(viewport_win, "frame_prim"):
+        return _frame_via_window_frame_prim
+    if viewport_api and hasattr(viewport_api, "get_viewport_camera_controller"):
+        return _frame_via_api_controller
+    if viewport_api and hasattr(viewport_api, "frame_selection"):
+        return _frame_via_api_frame_selection
+    if viewport_win and hasattr(viewport_win, "frame_selection"):
+        return _frame_via_window_frame_selection
+    if viewport_win and hasattr(viewport_win, "get_viewport_camera_controller"):
+        return _frame_via_window_controller
+    if hasattr(vp_utils, "get_active_viewport"):
+        return _frame_via_active_viewport
+    if hasattr(vp_utils, "frame_prim"):
+        return _frame_via_vp_utils
+    return None
+
+
+def _frame_via_commands(stage: Usd.Stage, paths: List[str]) -> bool:
+    """
+    Fallback when no viewport API could frame the prim.
+
+    Args:
+        stage: The current stage.
+        paths: The prim paths to frame.
+
+    Returns:
+        True if a command framed the prims.
+    """
+    # Use FramePrimsCommand with active viewport data or a temporary camera.
+    try:
+        active_viewport = vp_utils.get_active_viewport() if hasattr(vp_utils, "get_active_viewport") else None
+        time_code = Usd.TimeCode.Default()
+        resolution = (1, 1)
+        camera_path = None
+
+        if active_viewport:
+            time_code = getattr(active_viewport, "time", time_code)
+            res = getattr(active_viewport, "resolution", None)
+            if res and len(res) >= 2 and res[0] and res[1]:
+                resolution = res
+            camera_path = getattr(active_viewport, "camera_path", None)
+
+        if not camera_path:
+            camera_path = "/World/TempFocusCamera"
+            UsdGeom.Camera.Define(stage, camera_path)
+
+        aspect_ratio = resolution[0] / resolution[1] if resolution[1] else 1.0
+
+        kit_commands.execute(
+            "FramePrimsCommand",
+            prim_to_move=camera_path,
+            prims_to_frame=paths,
+            time_code=time_code,
+            aspect_ratio=aspect_ratio,
+            zoom=0.3,
+        )
+        return True
+    except Exception:
+        pass
+
+    # Try a set of known command names, some take paths, others use current selection.
+    command_attempts = [
+        ("FramePrims", {"paths": paths}),
+        ("FrameSelected", {}),
+        ("FrameSelectedCommand", {}),
+        ("FrameSelection", {}),
+        ("FrameViewportSelection", {}),
+        ("SelectAndFrame", {"paths": paths}),
+    ]
+    command_dict = getattr(kit_commands, "get_command_dict", None)
+    for cmd_name, kwargs in command_attempts:
+        try:
+            if command_dict:
+                available = command_dict()
+                if cmd_name not in available:
+                    continue
+            kit_commands.execute(cmd_name, **kwargs)
+            return True
+        except Exception:
+            continue
+    return False
+
+
 def _focus_prim(label: str) -> None:
     """
     Frames the viewport on the prim associated with the given label.
@@ -259,6 +853,8 @@ def _focus_prim(label: str) -> None:
     Args:
         label: The filter label whose prim should be focused.
     """
+    global _FRAME_STRATEGY
+
     info = csv_bridge.get_prim_info(label)
     if not info:
         carb.log_warn(f"[USD Explorer Filters] Cannot focus; no CSV entry for '{label}'")
@@ -270,138 +866,51 @@ def _focus_prim(label: str) -> None:
         carb.log_warn("[USD Explorer Filters] Cannot focus; no active USD stage.")
         return
 
-    focus_path = info.prim_paths[0] if getattr(info, "prim_paths", None) else info.prim_path
+    focus_path = info.prim_paths[0] if info.prim_paths else info.prim_path
+    paths = info.prim_paths or [focus_path]
     prim = stage.GetPrimAtPath(focus_path)
     if not prim or not prim.IsValid():
         carb.log_warn(f"[USD Explorer Filters] Cannot focus; prim not found: {focus_path}")
         return
 
-    # Preselect the prim so frame_selection fallbacks work across API versions.
+    # Try the active viewport API first; fall back to commands if needed.
     try:
-        selection = ctx.get_selection()
-        if selection:
-            selection.clear_selected_prim_paths()
-            selection.set_prim_path_selected(focus_path, True, False, False, False)
-            # Also set the main selection (covers older APIs)
-            try:
-                ctx.get_selection().set_selected_prim_paths([focus_path], False)
-            except Exception:
-                pass
+        viewport_win = vp_utils.get_active_viewport_window()
+        viewport_api = getattr(viewport_win, "viewport_api", None)
     except Exception:
-        pass
-
-    try:
-        # Try the active viewport API first; fall back to the window helper if needed.
         viewport_win = None
         viewport_api = None
 
-        try:
-            viewport_win = vp_utils.get_active_viewport_window()
-            viewport_api = getattr(viewport_win, "viewport_api", None)
-        except Exception:
-            viewport_win = None
-
+    # Probe the viewport API once; keep the result only if a viewport was found,
+    # since a viewport opened later may offer a better strategy.
+    strategy = _FRAME_STRATEGY
+    if strategy is None:
+        strategy = _resolve_frame_strategy(viewport_win, viewport_api)
+        if viewport_win is not None:
+            _FRAME_STRATEGY = strategy
+
+    # Each selection change notifies the Info tab and other listeners; only select
+    # the prim when the framing path relies on the current selection.
+    selection = ctx.get_selection()
+    selected = False
+    try:
         success = False
-        controller = None
-
-        # Newer APIs expose frame_prim on the viewport API; older ones expose it on the window.
-        if viewport_api and hasattr(viewport_api, "frame_prim"):
-            viewport_api.frame_prim(focus_path)
-            success = True
-        elif viewport_win and hasattr(viewport_win, "frame_prim"):
-            viewport_win.frame_prim(focus_path)
-            success = True
-        elif viewport_api and hasattr(viewport_api, "get_viewport_camera_controller"):
-            controller = viewport_api.get_viewport_camera_controller()
-            if controller and hasattr(controller, "frame_paths"):
-                controller.frame_paths(info.prim_paths if getattr(info, "prim_paths", None) else [focus_path])
-                success = True
-            elif controller and hasattr(controller, "frame_selection"):
-                controller.frame_selection()
-                success = True
-        elif viewport_api and hasattr(viewport_api, "frame_selection"):
-            viewport_api.frame_selection()
-            success = True
-        elif viewport_win and hasattr(viewport_win, "frame_selection"):
-            viewport_win.frame_selection()
-            success = True
-        elif viewport_api and hasattr(viewport_api, "get_viewport_camera_controller"):
-            controller = viewport_api.get_viewport_camera_controller()
-            if controller and hasattr(controller, "frame_selection"):
-                controller.frame_selection()
-                success = True
-        elif viewport_win and hasattr(viewport_win, "get_viewport_camera_controller"):
-            controller = viewport_win.get_viewport_camera_controller()
-            if controller and hasattr(controller, "frame_selection"):
-                controller.frame_selection()
-                success = True
-        elif hasattr(vp_utils, "get_active_viewport"):
-            try:
-                viewport = vp_utils.get_active_viewport()
-                if viewport and hasattr(viewport, "frame_selection"):
-                    viewport.frame_selection()
-                    success = True
-            except Exception:
-                pass
-        elif hasattr(vp_utils, "frame_prim"):
-            vp_utils.frame_prim(focus_path)
-            success = True
-
-        if not success:
-            # Use FramePrimsCommand with active viewport data or a temporary camera.
+        if strategy is not None:
+            if selection and strategy not in _PATH_FRAME_STRATEGIES:
+                selection.set_selected_prim_paths([focus_path], False)
+                selected = True
             try:
-                active_viewport = vp_utils.get_active_viewport() if hasattr(vp_utils, "get_active_viewport") else None
-                time_code = Usd.TimeCode.Default()
-                resolution = (1, 1)
-                camera_path = None
-
-                if active_viewport:
-                    time_code = getattr(active_viewport, "time", time_code)
-                    res = getattr(active_viewport, "resolution", None)
-                    if res and len(res) >= 2 and res[0] and res[1]:
-                        resolution = res
-                    camera_path = getattr(active_viewport, "camera_path", None)
-
-                if not camera_path:
-                    camera_path = "/World/TempFocusCamera"
-                    UsdGeom.Camera.Define(stage, camera_path)
-
-                aspect_ratio = resolution[0] / resolution[1] if resolution[1] else 1.0
-
-                kit_commands.execute(
-                    "FramePrimsCommand",
-                    prim_to_move=camera_path,
-                    prims_to_frame=info.prim_paths if getattr(info, "prim_paths", None) else [focus_path],
-                    time_code=time_code,
-                    aspect_ratio=aspect_ratio,
-                    zoom=0.3,
-                )
-                success = True
-            except Exception:
-                pass
+                success = strategy(viewport_win, viewport_api, focus_path, paths)
+            except AttributeError:
+                # The viewport changed under us; probe again on the next click
+                _FRAME_STRATEGY = None
 
         if not success:
-            # Try a set of known command names, some take paths, others use current selection.
-            command_attempts = [
-                ("FramePrims", {"paths": info.prim_paths if getattr(info, "prim_paths", None) else [focus_path]}),
-                ("FrameSelected", {}),
-                ("FrameSelectedCommand", {}),
-                ("FrameSelection", {}),
-                ("FrameViewportSelection", {}),
-                ("SelectAndFrame", {"paths": info.prim_paths if getattr(info, "prim_paths", None) else [focus_path]}),
-            ]
-            for cmd_name, kwargs in command_attempts:
-                try:
-                    command_dict = getattr(kit_commands, "get_command_dict", None)
-                    if command_dict:
-                        available = command_dict()
-                        if cmd_name not in available:
-                            continue
-                    kit_commands.execute(cmd_name, **kwargs)
-                    success = True
-                    break
-                except Exception:
-                    continue
+            # Some fallback commands frame the current selection
+            if selection and not selected:
+                selection.set_selected_prim_paths([focus_path], False)
+                selected = True
+            success = _frame_via_commands(stage, paths)
 
         if success:
             carb.log_info(f"[USD Explorer Filters] Focused prim: {focus_path}")
@@ -411,66 +920,97 @@ def _focus_prim(label: str) -> None:
         carb.log_error(f"[USD Explorer Filters] Failed to focus prim '{focus_path}': {e}")
     finally:
         # Clear selection so the UI does not leave the prim selected after focusing.
-        try:
-            selection = ctx.get_selection()
-            if selection:
-                selection.clear_selected_prim_paths()
-                selection.set_selected_prim_paths([], False)
-        except Exception:
-            pass
+        if selected:
+            selection.set_selected_prim_paths([], False)
 
 
 # ------------------------------------------------------------------------------
 # UI Construction
 # ------------------------------------------------------------------------------
 
-def _checkbox(label: str, default: bool = False) -> ui.SimpleBoolModel:
+def _checkbox(info: csv_bridge.PrimInfo, default: bool = False) -> ui.SimpleBoolModel:
     """
     Creates a checkbox with a label and returns its model.
     
     Args:
-        label: The text label for the checkbox.
+        info: The PrimInfo this checkbox toggles; its name is used as the label.
         default: Initial state.
         
     Returns:
         ui.SimpleBoolModel: The model controlling the checkbox state.
     """
+    label = info.name
     model = ui.SimpleBoolModel(default)
     _FILTER_MODELS[label] = model  # Register model
+    _LAST_VALUE[label] = default
     
-    ui.CheckBox(model=model)
-    ui.Spacer(width=6)
+    # Gaps come from the row's HStack spacing rather than separate Spacer widgets
+    ui.CheckBox(model=model, width=20)
     ui.Label(label, alignment=ui.Alignment.LEFT_CENTER)
-    ui.Spacer(width=4)
     ui.Button(
         "Focus",
         height=0,
         width=60,
-        clicked_fn=lambda l=label: _focus_prim(l),
+        clicked_fn=partial(_focus_prim, label),
         tooltip="Frame the viewport on this prim",
     )
-    model.add_value_changed_fn(lambda m: _on_checkbox_changed(label, m))
+    # Bind the PrimInfo so toggles need no CSV lookup
+    model.add_value_changed_fn(partial(_on_checkbox_changed, info))
     return model
 
 
+def _build_categories(grouped_info: Dict[str, List[csv_bridge.PrimInfo]]) -> None:
+    """
+    Builds one collapsible group of filter checkboxes per category.
+
+    Args:
+        grouped_info: Category -> entries, as returned by `csv_bridge.get_grouped_prim_info`.
+    """
+    # Clear old models when rebuilding UI to avoid leaks or stale references
+    _FILTER_MODELS.clear()
+    _LAST_VALUE.clear()
+
+    with ui.VStack(spacing=10, height=0):
+        # Iterate over categories and create collapsible frames
+        for category, items in grouped_info.items():
+            with ui.CollapsableFrame(title=category, collapsed=False):
+                with ui.VStack(spacing=4, height=0, style={"margin": 4}):
+                    for item in items:
+                        with ui.HStack(spacing=8, height=0):
+                            _checkbox(item, default=False)
+
+            ui.Spacer(height=4)
+
+
+async def _load_categories_async(categories_frame: ui.Frame) -> None:
+    """
+    Reloads the CSV off the UI thread, then fills `categories_frame` with the filters.
+
+    Args:
+        categories_frame: The placeholder frame created by `build_panel`.
+    """
+    # Let the skeleton draw before doing any file work
+    await omni.kit.app.get_app().next_update_async()
+
+    # Reload CSV to ensure we have the latest data (no-op if the file is unchanged).
+    # Only the parse runs on a worker thread; the new tables are swapped in here.
+    await csv_bridge.reload_csv_async()
+
+    # Group by category (memoized in csv_bridge until the CSV changes)
+    grouped_info = csv_bridge.get_grouped_prim_info()
+    categories_frame.set_build_fn(partial(_build_categories, grouped_info))
+    categories_frame.rebuild()
+
+
 def build_panel() -> None:
     """
     Builds the main content of the Filter tab.
     
     Dynamically generates collapsible groups and checkboxes based on the 
-    data loaded in `csv_bridge`.
+    data loaded in `csv_bridge`. The CSV is loaded in the background; the
+    categories appear once it is available.
     """
-    # Clear old models when rebuilding UI to avoid leaks or stale references
-    _FILTER_MODELS.clear()
-    
-    # Reload CSV to ensure we have the latest data
-    csv_bridge.reload_csv()
-    
-    # Get all data and group by category
-    all_info = csv_bridge.get_all_prim_info()
-    grouped_info = defaultdict(list)
-    for info in all_info:
-        grouped_info[info.category].append(info)
+    global _LOAD_TASK
 
     # Wrap everything in a nice padded column
     with ui.VStack(spacing=10, height=0, style={"margin": 10}):
@@ -485,15 +1025,10 @@ def build_panel() -> None:
         )
         ui.Spacer(height=6)
 
-        # Iterate over categories and create collapsible frames
-        for category, items in grouped_info.items():
-            with ui.CollapsableFrame(title=category, collapsed=False):
-                with ui.VStack(spacing=4, height=0, style={"margin": 4}):
-                    for item in items:
-                        with ui.HStack(spacing=4, height=0):
-                            _checkbox(item.name, default=False)
-            
-            ui.Spacer(height=4)
+        # Filled by _load_categories_async once the CSV is loaded
+        categories_frame = ui.Frame(height=0)
+        with categories_frame:
+            ui.Label("Loading filters...", style={"color": 0xFF707070})
 
         ui.Line()
         ui.Spacer(height=4)
@@ -507,3 +1042,8 @@ def build_panel() -> None:
                 "color": 0xFF707070,
             },
         )
+
+    # A rebuild replaces the frame, so a load still running for the old one is dropped
+    if _LOAD_TASK is not None:
+        _LOAD_TASK.cancel()
+    _LOAD_TASK = asyncio.ensure_future(_load_categories_async(categories_frame))